@@ -1,6 +1,29 @@
 from pathlib import Path
+from functools import lru_cache
 import sys
 
+
+@lru_cache(maxsize=8)
+def _parse_env_file(path_str, mtime_ns):
+    """
+    Parses a .env file into a dict of key/value pairs.
+
+    Cached per (path, mtime) so repeated lookups reuse the parse; editing
+    the file changes the mtime and invalidates the cached entry.
+    """
+    secrets = {}
+    for line in Path(path_str).read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        # Skip empty lines or comments
+        if not line or line.startswith('#'):
+            continue
+        # Key-Value pairs are assumed to be 'key=value'
+        key, sep, value = line.partition('=')
+        if sep:
+            secrets[key.strip()] = value.strip()
+    return secrets
+
+
 def load_secret(secret_key, env_file=".env"):
     """
     Loads a secret value from a .env file.
@@ -17,28 +40,14 @@ def load_secret(secret_key, env_file=".env"):
         # Running in PyCharm or directly from source, resolve from the current working directory
         env_file_path = Path.cwd() / env_file
 
-    print(f"Looking for .env file at: {env_file_path}")  # Debugging line
-
-    secrets = {}
-
     # Check if the .env file exists at the calculated path
     if not env_file_path.exists():
         print(f"Warning: {env_file_path} not found.")
         # You can choose to raise an error here or handle it differently
         # raise FileNotFoundError(f"{env_file_path} not found.")
+        return None
 
-    # Load secrets from the .env file if it exists
-    if env_file_path.exists():
-        with open(env_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines or comments
-                if not line or line.startswith('#'):
-                    continue
-                # Key-Value pairs are assumed to be 'key=value'
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    secrets[key.strip()] = value.strip()
+    secrets = _parse_env_file(str(env_file_path), env_file_path.stat().st_mtime_ns)
 
     # Return the value of the secret if it exists
     return secrets.get(secret_key)
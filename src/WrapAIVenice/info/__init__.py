@@ -2,12 +2,24 @@
 
 import logging
 
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
 # Create a logger for your library
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Shared HTTP session so info calls reuse one pooled keep-alive connection
+# instead of paying a TCP+TLS handshake per request
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+))
+
 # __all__ = ['']
 
 def some_function():
     logger.debug("This is a debug message from my_library.")
-
@@ -1,67 +1,71 @@
 # account_info.py
 
-import requests
-from pprint import PrettyPrinter
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Logger Configuration
 logger = logging.getLogger(__name__)
 
 from ..wv_core import KEY_URL, RATE_LIMIT_API_URL, RATE_LIMIT_MODEL_URL
+from ..utils.json import json_dumps_bytes
+from . import SESSION
 
 class VeniceApiKeyInfo:
     def __init__(self, api_key):
         self.api_key = api_key
+        self.headers = {"Authorization": f"Bearer {self.api_key}"}
 
-    def list_api_keys(self):
-        url = KEY_URL
-
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        response = requests.get(url, headers=headers)
+    # Fetch methods (pure data, no printing)
+    def fetch_api_keys(self) -> dict:
+        """Returns the API keys listing as parsed JSON."""
+        response = SESSION.get(KEY_URL, headers=self.headers, timeout=(3, 30))
         response.raise_for_status()  # Check for HTTP errors
+        return response.json()
 
-        # Parse the JSON data
-        data = response.json()
-
-
-        # Initialize pretty printer
-        pp = PrettyPrinter(indent=2)
-
-        # Print both raw and formatted versions
-        print("Raw response:")
-        print(response.text)
-
-        print("\nFormatted output:")
-        pp.pprint(data)
-
-    def list_api_key_rate_limits(self):
-        url = RATE_LIMIT_API_URL
-
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-
-        response = requests.request("GET", url, headers=headers)
-
+    def fetch_api_key_rate_limits(self) -> dict:
+        """Returns the API key rate limits as parsed JSON."""
+        response = SESSION.get(RATE_LIMIT_API_URL, headers=self.headers, timeout=(3, 30))
         response.raise_for_status()  # Check for HTTP errors
+        return response.json()
 
-        # Parse the JSON data
-        data = response.json()
-
-        # Initialize pretty printer
-        pp = PrettyPrinter(indent=2)
+    def fetch_model_rate_limits(self) -> dict:
+        """Returns the per-model rate limit log as parsed JSON."""
+        response = SESSION.get(RATE_LIMIT_MODEL_URL, headers=self.headers, timeout=(3, 30))
+        response.raise_for_status()  # Check for HTTP errors
+        return response.json()
+
+    def fetch_all_admin_info(self, max_workers=3) -> dict:
+        """Fetches keys, key rate limits, and model rate limits concurrently.
+
+        The three GETs run in parallel on the shared session, so the combined
+        call costs roughly the slowest request instead of the sum of all three.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            keys_future = pool.submit(self.fetch_api_keys)
+            rate_future = pool.submit(self.fetch_api_key_rate_limits)
+            model_future = pool.submit(self.fetch_model_rate_limits)
+            return {
+                "keys": keys_future.result(),
+                "rate_limits": rate_future.result(),
+                "model_limits": model_future.result(),
+            }
+
+    # Print methods (optional formatting on top of the fetchers)
+    @staticmethod
+    def _print_formatted(data):
+        # Single serialization; much faster than PrettyPrinter on large payloads
+        print(json_dumps_bytes(data, pretty=True).decode())
 
-        # Print both raw and formatted versions
-        print("Raw response:")
-        print(response.text)
+    def list_api_keys(self):
+        data = self.fetch_api_keys()
+        print("Formatted output:")
+        self._print_formatted(data)
 
-        print("\nFormatted output:")
-        pp.pprint(data)
+    def list_api_key_rate_limits(self):
+        data = self.fetch_api_key_rate_limits()
+        print("Formatted output:")
+        self._print_formatted(data)
 
     def get_model_rate_limits(self):
-        url = RATE_LIMIT_MODEL_URL
-
-        # payload = {}
-        headers = {f"Authorization": f"Bearer {self.api_key}"}
-
-        response = requests.request("GET", url, headers=headers)  # , data=payload
-
-        print(response.text)
\ No newline at end of file
+        data = self.fetch_model_rate_limits()
+        self._print_formatted(data)
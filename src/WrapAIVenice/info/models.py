@@ -1,13 +1,31 @@
 # models.py
 
+import threading
+import time
+
 import requests
 import logging
 
 from ..wv_core import BASE_URL
+from . import SESSION
 
 # Logger Configuration
 logger = logging.getLogger(__name__)
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Parse failures differ per backend: the stdlib raises json.JSONDecodeError
+# (a ValueError), ijson its own JSONError hierarchy
+_JSON_PARSE_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+# Process-wide models cache so multiple sessions share one fetch
+MODELS_CACHE_TTL = 3600  # seconds
+_models_cache = {}
+_models_cache_lock = threading.Lock()
+
 
 class VeniceModels:
     def __init__(self, api_key, base_url=BASE_URL):
@@ -15,19 +33,51 @@ class VeniceModels:
         self.base_url = base_url
         self.headers = {"Authorization": f"Bearer {self.api_key}"}
         self.models_data = []  # To store models data after fetching
+        self._tokens_by_model = {}  # id -> availableContextTokens, built after fetch
 
     # Fetch method
-    def fetch_models(self):
-        """Fetches the models from the API and stores them in the instance."""
-        url = f"{self.base_url}/models"
-        try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            response_json = response.json()
-            self.models_data = response_json.get("data", [])
-        except requests.exceptions.RequestException as e:
-            logger.error(f"An error occurred: {e}")
-            self.models_data = []
+    def fetch_models(self, force_refresh=False):
+        """Fetches the models from the API, reusing a process-wide cache when still fresh."""
+        cache_key = (self.api_key, self.base_url)
+        with _models_cache_lock:
+            if not force_refresh:
+                cached = _models_cache.get(cache_key)
+                if cached and (time.monotonic() - cached[0]) < MODELS_CACHE_TTL:
+                    self.models_data = cached[1]
+                    self._index_models()
+                    return
+
+            url = f"{self.base_url}/models"
+            try:
+                if ijson is not None:
+                    # Stream-parse the model entries instead of materializing
+                    # the whole response document at once
+                    response = SESSION.get(url, headers=self.headers, timeout=(3, 30), stream=True)
+                    response.raise_for_status()  # Raise an exception for HTTP errors
+                    response.raw.decode_content = True
+                    self.models_data = list(ijson.items(response.raw, "data.item"))
+                else:
+                    response = SESSION.get(url, headers=self.headers, timeout=(3, 30))
+                    response.raise_for_status()  # Raise an exception for HTTP errors
+                    response_json = response.json()
+                    self.models_data = response_json.get("data", [])
+                _models_cache[cache_key] = (time.monotonic(), self.models_data)
+            except requests.exceptions.RequestException as e:
+                logger.error("An error occurred: %s", e)
+                self.models_data = []
+            except _JSON_PARSE_ERRORS as e:
+                # Truncated or malformed models payload; degrade to an empty
+                # list rather than failing the caller's first prompt
+                logger.error("Could not parse models response: %s", e)
+                self.models_data = []
+            self._index_models()
+
+    def _index_models(self):
+        """Rebuilds the per-model token-limit index from models_data."""
+        self._tokens_by_model = {
+            model.get("id"): model.get("model_spec", {}).get("availableContextTokens", "N/A")
+            for model in self.models_data
+        }
 
     # Get methods
     def get_model_names(self):
@@ -43,7 +93,4 @@ class VeniceModels:
 
     def get_tokens_by_model_name(self, model_name):
         """Returns the available context tokens for a specific model name."""
-        for model in self.models_data:
-            if model.get("id") == model_name:
-                return model.get("model_spec", {}).get("availableContextTokens", "N/A")
-        return "Model not found"
+        return self._tokens_by_model.get(model_name, "Model not found")
@@ -8,7 +8,7 @@ Includes:
 """
 
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Optional, List, Dict, Any
 
 import logging
@@ -19,7 +19,34 @@ logger = logging.getLogger(__name__)
 from .wv_core import WEB_SEARCH_MODES
 
 
-@dataclass
+def _specialize_to_dict(cls):
+    """Replaces to_dict with a version generated for the class's exact fields.
+
+    The field list is fixed at class-definition time, so the generated
+    function inlines one None check per field instead of iterating
+    __dict__ and branching per key on every prompt send. Nested
+    venice_parameters values are converted via their own to_dict.
+    """
+    lines = ["def to_dict(self):", "    result = {}"]
+    for f in fields(cls):
+        lines.append(f"    v = self.{f.name}")
+        lines.append("    if v is not None:")
+        if f.name == "venice_parameters":
+            lines.append("        result['venice_parameters'] = v.to_dict()")
+        else:
+            lines.append(f"        result['{f.name}'] = v")
+    lines.append("    return result")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    generated = namespace["to_dict"]
+    generated.__doc__ = cls.to_dict.__doc__
+    cls.to_dict = generated
+    return cls
+
+
+@_specialize_to_dict
+@dataclass(frozen=True, slots=True)
 class VeniceParameters:
     enable_web_search: Optional[str] = None
     include_venice_system_prompt: Optional[bool] = None
@@ -33,10 +60,11 @@ class VeniceParameters:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding None values to keep output clean."""
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {f.name: v for f in fields(self) if (v := getattr(self, f.name)) is not None}
 
 
-@dataclass
+@_specialize_to_dict
+@dataclass(slots=True)
 class PromptAttributes:
     """
     Venice parameters for dictionary:
@@ -74,12 +102,6 @@ class PromptAttributes:
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the dataclass to a dictionary, filtering out None values."""
-        result = {}
-        for k, v in self.__dict__.items():
-            if v is not None:
-                # Convert nested dataclass to dict
-                if k == 'venice_parameters':
-                    result[k] = v.to_dict()
-                else:
-                    result[k] = v
-        return result
+        # Convert the nested venice_parameters dataclass to a dict
+        return {f.name: v.to_dict() if f.name == 'venice_parameters' else v
+                for f in fields(self) if (v := getattr(self, f.name)) is not None}
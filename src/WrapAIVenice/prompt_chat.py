@@ -9,6 +9,8 @@ Includes:
 """
 
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Logger Configuration
 logger = logging.getLogger(__name__)
@@ -16,55 +18,100 @@ logger = logging.getLogger(__name__)
 from .prompt_text import VeniceTextPrompt
 from .prompt_chat_memory import ConversationMemory
 from .info.models import VeniceModels
+from .wv_core import WSChatMemoryDefaults
 
 
 
 class VeniceChatPrompt:
+    # VeniceTextPrompt methods bound directly on the instance so hot-path
+    # lookups skip the __getattr__ fallback entirely
+    _FORWARDED_METHODS = (
+        "set_attributes", "get_response", "get_usage", "get_think", "get_model",
+        "parse_response", "save_all", "save_response", "save_text_response",
+        "get_structured_payload_for_hash", "get_hash",
+    )
+
+    # The forwarded method names need slots of their own since __init__ binds
+    # them on the instance
+    __slots__ = _FORWARDED_METHODS + (
+        "_venice", "_summary_model", "_models",
+        "_memory_limit_resolved", "_last_summarized_tokens", "memory",
+    )
+
     def __init__(self, api_key, model, summary_model=None, **kwargs):
         # Compose the original class
         self._venice = VeniceTextPrompt(api_key, model, **kwargs)
         self._summary_model = summary_model
 
-        # Initialize model token manager
-        self._models = VeniceModels(api_key)
-        self._models.fetch_models()
+        for name in self._FORWARDED_METHODS:
+            setattr(self, name, getattr(self._venice, name))
 
-        model_token_limit = self._models.get_tokens_by_model_name(model)
-        if isinstance(model_token_limit, int):
-            max_context_tokens = model_token_limit
-        else:
-            logger.warning(f"Unknown max tokens for model '{model}', defaulting to 8000.")
-            max_context_tokens = 8000
+        # Initialize model token manager; the model list is fetched lazily on
+        # first use so building a session does not block on a network call
+        self._models = VeniceModels(api_key)
+        self._memory_limit_resolved = False
+        self._last_summarized_tokens = None  # token count after the last compression
 
-        # Memory setup with dynamic token max
+        # Memory setup; max_tokens is updated once the model list is available
         self.memory = ConversationMemory(
             system_prompt=kwargs.get('system_prompt', "You are helpful"),
-            max_tokens=max_context_tokens
+            max_tokens=WSChatMemoryDefaults.MAX_TOKENS
         )
 
     # Attribute change methods
     def __getattr__(self, name):
-        """Automatically delegate undefined attributes/methods to _venice"""
+        """Slow-path fallback: delegate anything not bound above to _venice"""
         return getattr(self._venice, name)
 
+    @property
+    def model(self):
+        """Active model id on the underlying VeniceTextPrompt.
+
+        A real property beats the __getattr__ fallback for this hot read, and
+        assignment forwards to the composed client instead of shadowing it on
+        the wrapper. Use set_model to also refresh the memory token limit.
+        """
+        return self._venice.model
+
+    @model.setter
+    def model(self, model_id):
+        self._venice.model = model_id
+
     def set_model(self, model_id):
         """Sets a new model and updates token limit if available."""
         self._venice.model = model_id
         self._ensure_models_loaded()
+        self._memory_limit_resolved = True
 
         model_token_limit = self._models.get_tokens_by_model_name(model_id)
         if isinstance(model_token_limit, int):
             self.memory.max_tokens = model_token_limit
         else:
-            logger.warning(f"Unknown max tokens for model '{model_id}', keeping previous value.")
+            logger.warning("Unknown max tokens for model '%s', keeping previous value.", model_id)
 
     def _ensure_models_loaded(self):
         if not self._models.models_data:
             self._models.fetch_models()
 
+    def _ensure_memory_limit(self):
+        """Resolves the model's context size on first use instead of in __init__."""
+        if self._memory_limit_resolved:
+            return
+        self._memory_limit_resolved = True
+        self._ensure_models_loaded()
+
+        model_token_limit = self._models.get_tokens_by_model_name(self._venice.model)
+        if isinstance(model_token_limit, int):
+            self.memory.max_tokens = model_token_limit
+        else:
+            logger.warning("Unknown max tokens for model '%s', defaulting to %d.",
+                           self._venice.model, self.memory.max_tokens)
+
     # Prompt methods
     def prompt(self, user_prompt, system_prompt=None):
         """Modified prompt with memory management"""
+        self._ensure_memory_limit()
+
         # Memory handling logic
         if system_prompt:
             self.memory.update_system_prompt(system_prompt)
@@ -78,13 +125,27 @@ class VeniceChatPrompt:
             self.memory.add_message("assistant", response.get('response', ''))
         return response
 
-    def summarize_memory(self, summary_prompt="Summarize this conversation.", model_override=None, buffer=200):
+    def summarize_memory(self, summary_prompt="Summarize this conversation.", model_override=None,
+                         buffer=200, messages=None):
         """
         Summarizes the current memory using the chat model (or optional override).
         Trims memory to fit within token limits of the selected model.
+        Pass `messages` to summarize only that slice of memory instead of the
+        whole history.
         """
+        summary = self._summarize_messages(summary_prompt, model_override, buffer, messages)
+        return summary if summary is not None else "Summary not available."
+
+    def _summarize_messages(self, summary_prompt, model_override=None, buffer=200, messages=None):
+        """Like summarize_memory, but returns None on failure so callers can
+        tell a real summary from the fallback string."""
         summary_model = model_override or self._summary_model or self._venice.model
-        messages = self.get_trimmed_messages_for_model(summary_model, summary_prompt, buffer)
+        if messages is None:
+            messages = self.get_trimmed_messages_for_model(summary_model, summary_prompt, buffer)
+        else:
+            messages = [{"role": msg["role"], "content": msg["content"]}
+                        for msg in (self.memory.messages[0], *messages)]
+            messages.append({"role": "user", "content": summary_prompt})
 
         old_model = self._venice.model
         self._venice.model = summary_model
@@ -95,7 +156,18 @@ class VeniceChatPrompt:
 
         if response:
             return response.get("response", "").strip()
-        return "Summary not available."
+        return None
+
+    def _summary_token_budget(self, summary_model, summary_prompt, buffer=200):
+        """Token budget left for history messages in a summarization request,
+        after the summary model's limit covers the system message, the summary
+        prompt, and the response buffer."""
+        model_token_limit = self._models.get_tokens_by_model_name(summary_model)
+        if not isinstance(model_token_limit, int):
+            model_token_limit = self.memory.max_tokens
+        return (model_token_limit - buffer
+                - self.memory.calculate_tokens(summary_prompt)
+                - self.memory.messages[0]["tokens"])
 
     def get_trimmed_messages_for_model(self, model, summary_prompt, buffer=200):
         """
@@ -104,38 +176,106 @@ class VeniceChatPrompt:
         self._ensure_models_loaded()
         model_token_limit = self._models.get_tokens_by_model_name(model)
         if not isinstance(model_token_limit, int):
-            logger.warning(f"Unknown token limit for model '{model}'. Using current memory limit.")
+            logger.warning("Unknown token limit for model '%s'. Using current memory limit.", model)
             model_token_limit = self.memory.max_tokens
 
         # Estimate token cost of summary prompt
         summary_prompt_tokens = self.memory.calculate_tokens(summary_prompt)
         target_limit = model_token_limit - buffer - summary_prompt_tokens
 
-        # Start with system message
-        trimmed = [self.memory.messages[0]]
-        current_tokens = self.memory.calculate_tokens(self.memory.messages[0]["content"])
-
-        # Add most recent messages in reverse order until we hit the target
+        # Collect most recent messages in reverse order until we hit the target,
+        # reusing the token counts cached at insertion time
+        picked = deque()
+        current_tokens = self.memory.messages[0]["tokens"]
         for msg in reversed(self.memory.messages[1:]):
-            msg_tokens = self.memory.calculate_tokens(msg["content"])
+            msg_tokens = msg["tokens"]
             if current_tokens + msg_tokens > target_limit:
                 break
-            trimmed.insert(1, msg)
+            picked.appendleft(msg)
             current_tokens += msg_tokens
 
-        # Add the summary prompt
+        # System message first, then the picked window, stripping cached token
+        # counts for the API payload, then the summary prompt
+        trimmed = [{"role": msg["role"], "content": msg["content"]}
+                   for msg in (self.memory.messages[0], *picked)]
         trimmed.append({"role": "user", "content": summary_prompt})
-        logger.info(f"Trimmed messages to {len(trimmed)} to fit {model} with buffer {buffer}")
+        logger.info("Trimmed messages to %d to fit %s with buffer %d", len(trimmed), model, buffer)
         return trimmed
 
+    # Fraction of the context window that triggers summarization
+    SUMMARY_WATERMARK = 0.8
+
     def trim_and_summarize_if_needed(self, summary_prompt="Summarize this conversation.", model_override=None):
         """
-        Summarizes and resets memory if nearing token limit.
+        Compresses memory once the token count crosses the high watermark.
+
+        Only the oldest half of the conversation window is summarized and
+        replaced; recent turns stay verbatim, so long-running sessions pay an
+        incremental cost instead of re-summarizing the full history each time.
         """
-        if self.memory.token_count > self.memory.max_tokens * 0.8:
-            summary = self.summarize_memory(summary_prompt, model_override)
+        self._ensure_memory_limit()
+        token_count = self.memory.token_count
+        if token_count <= self.memory.max_tokens * self.SUMMARY_WATERMARK:
+            return
+
+        # If the last compression could not get below the watermark, wait for
+        # actual growth before paying for another summarization round trip
+        if (self._last_summarized_tokens is not None
+                and token_count <= self._last_summarized_tokens):
+            return
+
+        history = self.memory.messages[1:]
+        if len(history) < 4:
+            # Window too small to split; fall back to a full reset with summary
+            summary = self._summarize_messages(summary_prompt, model_override)
+            if summary is None:
+                logger.warning("Summarization failed; keeping memory unchanged.")
+                return
             self.memory.reset_with_summary(summary)
+        else:
+            split = len(history) // 2
+            # Bound the slice by the summary model's context window: half the
+            # chat model's history can exceed a smaller summary model's limit
+            summary_model = model_override or self._summary_model or self._venice.model
+            self._ensure_models_loaded()
+            budget = self._summary_token_budget(summary_model, summary_prompt)
+            slice_tokens = 0
+            bounded = 0
+            for msg in history[:split]:
+                slice_tokens += msg["tokens"]
+                if slice_tokens > budget:
+                    break
+                bounded += 1
+            if bounded == 0:
+                logger.warning("Oldest message exceeds summary model '%s' budget; "
+                               "skipping summarization.", summary_model)
+                return
+            split = bounded
+
+            summary = self._summarize_messages(summary_prompt, model_override,
+                                               messages=history[:split])
+            if summary is None:
+                # Leave the history intact rather than replacing it with a
+                # failure string; the watermark check will retry next call
+                logger.warning("Summarization failed; keeping memory unchanged.")
+                return
+            self.memory.compress_oldest(summary, keep_count=len(history) - split)
+
+        self._last_summarized_tokens = self.memory.token_count
 
     # Clear memory method
     def clear_memory(self):
         self.memory.reset()
+
+
+def summarize_sessions(sessions, summary_prompt="Summarize this conversation.", max_workers=8):
+    """
+    Summarizes several chat sessions concurrently.
+
+    Venice exposes no multi-item summarization endpoint, so requests are
+    coalesced at the connection level instead: the calls run in parallel on
+    a thread pool, bounding total wall time by the slowest request rather
+    than the sum. Returns summaries in the same order as `sessions`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda session: session.summarize_memory(summary_prompt), sessions))
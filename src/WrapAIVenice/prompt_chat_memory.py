@@ -7,7 +7,7 @@ Includes:
   and supports system prompt updates and summarization.
 """
 
-from .utils.tokens_char import count_characters_and_tokens
+from .utils.tokens_char import count_tokens, cached_token_count
 from .wv_core import WSChatMemoryDefaults
 
 
@@ -26,9 +26,11 @@ class ConversationMemory:
     def update_system_prompt(self, prompt):
         if self.messages and self.messages[0]["role"] == "system":
             self.messages[0]["content"] = prompt
+            self.messages[0]["tokens"] = cached_token_count(prompt)
         else:
-            self.messages.insert(0, {"role": "system", "content": prompt})
-        self.current_tokens = sum(self.calculate_tokens(msg["content"]) for msg in self.messages)
+            self.messages.insert(0, {"role": "system", "content": prompt,
+                                     "tokens": cached_token_count(prompt)})
+        self.current_tokens = sum(msg["tokens"] for msg in self.messages)
 
     def reset(self):
         self.messages = []
@@ -36,8 +38,11 @@ class ConversationMemory:
 
     def add_message(self, role, content):
         """Add message to memory with automatic trimming"""
-        new_msg = {"role": role, "content": content}
-        tokens = self.calculate_tokens(content)
+        # Tokenize once at insertion; the cached count is reused by every
+        # trim/summarize pass. System prompts are usually shared constants,
+        # so their counts come from the process-wide cache.
+        tokens = cached_token_count(content) if role == "system" else self.calculate_tokens(content)
+        new_msg = {"role": role, "content": content, "tokens": tokens}
 
         if self._will_exceed_limit(tokens):
             self.trim_messages(tokens)
@@ -50,7 +55,7 @@ class ConversationMemory:
         target = self.max_tokens - self.token_buffer - incoming_tokens
         while self.current_tokens > target and len(self.messages) > 1:
             removed = self.messages.pop(1)  # Keep system prompt
-            self.current_tokens -= self.calculate_tokens(removed["content"])
+            self.current_tokens -= removed["tokens"]
 
     def reset_with_summary(self, summary):
         """Replace memory with summary and preserve recent context.
@@ -63,29 +68,49 @@ class ConversationMemory:
         recent = self.messages[-4:] if len(self.messages) >=4 else self.messages
 
         # New message list
+        new_system_content = f"{system_msg['content']}\nSUMMARY: {summary}"
         self.messages = [
                             {
                                 "role": system_msg["role"],
-                                "content": f"{system_msg['content']}\nSUMMARY: {summary}"
+                                "content": new_system_content,
+                                "tokens": self.calculate_tokens(new_system_content)
                             }
                         ] + recent
 
-        # Recalculate tokens
-        self.current_tokens = sum(
-            self.calculate_tokens(msg["content"])
-            for msg in self.messages
-        )
+        # Recalculate tokens from the cached per-message counts
+        self.current_tokens = sum(msg["tokens"] for msg in self.messages)
+
+    def compress_oldest(self, summary, keep_count=4):
+        """Replace the oldest non-system messages with a single summary message.
+
+        Keeps the system prompt and the `keep_count` most recent messages so
+        the live window stays verbatim while older history collapses into one
+        compact summary block. Token totals update incrementally.
+        """
+        if len(self.messages) <= keep_count + 1:
+            return
+
+        recent = self.messages[-keep_count:] if keep_count else []
+        summary_content = f"SUMMARY: {summary}"
+        summary_msg = {
+            "role": "system",
+            "content": summary_content,
+            "tokens": self.calculate_tokens(summary_content)
+        }
+
+        self.messages = [self.messages[0], summary_msg] + recent
+        self.current_tokens = sum(msg["tokens"] for msg in self.messages)
 
     def calculate_tokens(self, text):
-        _, tokens = count_characters_and_tokens(text)
-        return tokens
+        return count_tokens(text)
 
     def _will_exceed_limit(self, incoming):
         return (self.current_tokens + incoming) > (self.max_tokens - self.token_buffer)
 
     @property
     def message_history(self):
-        return self.messages.copy()
+        # Strip the cached token counts so the history is safe to send as an API payload
+        return [{"role": msg["role"], "content": msg["content"]} for msg in self.messages]
 
     @property
     def token_count(self):
@@ -3,14 +3,16 @@
 Handles storage, loading, and management of prompt templates.
 
 Includes:
-- `PromptManager`: Reads/writes prompt templates to JSON with metadata.
+- `PromptManager`: Reads/writes prompt templates to an append-only JSONL log
+  (one record per line) with metadata, compacting when the log grows.
 """
 
 
 import json
+import sys
+from dataclasses import fields, is_dataclass, replace
 from pathlib import Path
 from typing import Dict, Optional, Any
-import copy
 import logging
 
 # Logger Configuration
@@ -18,6 +20,46 @@ logger = logging.getLogger(__name__)
 
 from .prompt_attributes import VeniceParameters
 from .prompt_template import PromptTemplate
+from .utils.json import json_loads, json_dumps_bytes
+
+# Template field names resolved once at import instead of per loaded entry
+_TEMPLATE_FIELDS = tuple(f.name for f in fields(PromptTemplate))
+
+
+def _build_template(data: Dict[str, Any]) -> PromptTemplate:
+    """Builds a PromptTemplate from on-disk data, dropping unknown keys."""
+    kwargs = {k: data[k] for k in _TEMPLATE_FIELDS if k in data}
+
+    # Intern the small repeated category strings so large prompt libraries
+    # share one copy per distinct value
+    for key in ("program", "type"):
+        value = kwargs.get(key)
+        if isinstance(value, str):
+            kwargs[key] = sys.intern(value)
+
+    return PromptTemplate(**kwargs)
+
+
+def _template_dict(prompt: PromptTemplate) -> Dict[str, Any]:
+    """Field-name/value mapping for a template (PromptTemplate is slotted, so no __dict__)."""
+    return {name: getattr(prompt, name) for name in _TEMPLATE_FIELDS}
+
+
+def _clone_attrs(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Structured copy of a default_attributes dict.
+
+    The values are primitives, flat containers, or small dataclasses, so a
+    targeted per-type copy replaces the generic (and much slower)
+    copy.deepcopy traversal. Frozen VeniceParameters instances are shared
+    as-is since they cannot be mutated.
+    """
+    return {
+        k: (v.copy() if isinstance(v, (dict, list))
+            else v if isinstance(v, VeniceParameters)
+            else replace(v) if is_dataclass(v)
+            else v)
+        for k, v in attributes.items()
+    }
 
 
 class PromptManager:
@@ -26,10 +68,16 @@ class PromptManager:
     FILE_TYPE = "prompts"
     GENERATOR = "direct"
 
-    def __init__(self, file_name: Optional[str] = "prompts.json"):
-        """Initialize the manager, load metadata, and prepare prompt storage."""
+    def __init__(self, file_name: Optional[str] = "prompts.jsonl"):
+        """Initialize the manager, load metadata, and prepare prompt storage.
+
+        The default store is an append-only JSONL log: one header record
+        followed by `put`/`del` operation records. Legacy `.json` files
+        (single JSON object with header/data) are still read and written.
+        """
         self.prompts: Dict[str, PromptTemplate] = {}
         self.file_path = Path(file_name)
+        self._log_ops = 0  # op records in the log since the last compaction
 
         self.header = {
             "app_name": self.APP_NAME,
@@ -45,50 +93,100 @@ class PromptManager:
 
         self.load_from_file()  # Load prompts from file
 
+    @property
+    def _is_legacy_json(self) -> bool:
+        return self.file_path.suffix == ".json"
+
     def load_from_file(self):
-        """Loads prompts from a JSON file."""
+        """Loads prompts by replaying the JSONL log (or reading a legacy JSON file)."""
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
-                json_data = json.load(f)
+            if self._is_legacy_json:
+                json_data = json_loads(self.file_path.read_bytes())
 
-            # Extract header information
-            self.header = json_data.get("header", self.header)
+                # Extract header information
+                self.header = json_data.get("header", self.header)
 
-            # Load prompts
-            self.prompts = {
-                name: PromptTemplate(**data)
-                for name, data in json_data.get("data", {}).items()
-            }
+                # Load prompts
+                self.prompts = {
+                    name: _build_template(data)
+                    for name, data in json_data.get("data", {}).items()
+                }
+            else:
+                self.prompts = {}
+                self._log_ops = 0
+                with self.file_path.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        record = json_loads(line)
+                        if "header" in record:
+                            self.header = record["header"]
+                            continue
+                        op = record.get("op")
+                        if op == "put":
+                            self.prompts[record["name"]] = _build_template(record.get("data", {}))
+                        elif op == "del":
+                            self.prompts.pop(record["name"], None)
+                        self._log_ops += 1
 
             logger.info(f"✅ Loaded {len(self.prompts)} prompts from {self.file_path}")
 
 
-        except (IOError, json.JSONDecodeError) as err:
+        except (IOError, ValueError) as err:
             logger.error(f"❌ Error loading {self.file_path}: {err}")
 
     def save_to_file(self):
-        """Saves prompts and metadata to a JSON file."""
+        """Writes a compacted snapshot of prompts and metadata to the store."""
         try:
-            json_structure = {
-                "header": self.header,
-                "data": {name: prompt.__dict__ for name, prompt in self.prompts.items()},
-                # "data": {name: asdict(prompt) for name, prompt in self.prompts.items()},
-
-            }
+            if self._is_legacy_json:
+                json_structure = {
+                    "header": self.header,
+                    "data": {name: _template_dict(prompt) for name, prompt in self.prompts.items()},
+                }
 
-            with self.file_path.open("w", encoding="utf-8") as f:
-                json.dump(json_structure, f, indent=4)
+                self.file_path.write_bytes(json_dumps_bytes(json_structure, pretty=True))
+            else:
+                with self.file_path.open("wb") as f:
+                    f.write(json_dumps_bytes({"header": self.header}) + b"\n")
+                    for name, prompt in self.prompts.items():
+                        record = {"op": "put", "name": name, "data": _template_dict(prompt)}
+                        f.write(json_dumps_bytes(record) + b"\n")
+                self._log_ops = len(self.prompts)
 
             logger.info(f"✅ Prompts saved to {self.file_path}")
 
         except (IOError, TypeError) as err:
             logger.error(f"❌ Error saving to {self.file_path}: {err}")
 
+    def compact(self, force: bool = False):
+        """Rewrites the log as a snapshot once it holds over twice the live prompts."""
+        if force or self._log_ops > 2 * max(len(self.prompts), 1):
+            self.save_to_file()
+
+    def _append_op(self, op: str, name: str, data: Optional[Dict[str, Any]] = None):
+        """Appends a single operation record to the JSONL log."""
+        if self._is_legacy_json:
+            return  # Legacy files are rewritten explicitly via save_to_file()
+
+        record: Dict[str, Any] = {"op": op, "name": name}
+        if data is not None:
+            record["data"] = data
+
+        try:
+            with self.file_path.open("ab") as f:
+                f.write(json_dumps_bytes(record) + b"\n")
+            self._log_ops += 1
+        except (IOError, TypeError) as err:
+            logger.error(f"❌ Error appending to {self.file_path}: {err}")
+
+        self.compact()
+
     def get_full_json(self):
         """Returns the full prompt dataset in JSON format."""
         return {
             "header": self.header,
-            "data": {name: prompt.__dict__ for name, prompt in self.prompts.items()},
+            "data": {name: _template_dict(prompt) for name, prompt in self.prompts.items()},
         }
 
     def get_prompt(self, name: str) -> Optional[PromptTemplate]:
@@ -107,11 +205,13 @@ class PromptManager:
                 logger.warning(f"⚠️ Prompt with name '{prompt.name}' exists but is different. Overwriting.")
 
         self.prompts[prompt.name] = prompt
+        self._append_op("put", prompt.name, _template_dict(prompt))
 
     def remove_prompt(self, name: str):
         """Removes a prompt by name."""
         if name in self.prompts:
             del self.prompts[name]
+            self._append_op("del", name)
             logger.info(f"Removed prompt: {name}")
         else:
             logger.warning(f"Prompt '{name}' not found.")
@@ -136,7 +236,7 @@ class PromptManager:
 
     def get_prompt_attributes(self, name: str) -> Dict[str, Any]:
         prompt = self.get_prompt(name)
-        attributes = copy.deepcopy(prompt.default_attributes) if prompt else {}
+        attributes = _clone_attrs(prompt.default_attributes) if prompt else {}
 
         # Ensure venice_parameters is always included
         if "venice_parameters" not in attributes:
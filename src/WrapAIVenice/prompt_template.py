@@ -8,11 +8,11 @@ Includes:
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Any, Callable
 import hashlib
-import copy
 
 import logging
 
@@ -22,8 +22,39 @@ logger = logging.getLogger(__name__)
 from .prompt_attributes import VeniceParameters
 from .handlers import FILE_HANDLERS
 
+# Placeholder patterns compiled once at import; per-call re.* lookups thrash
+# the small internal regex cache when many templates/keys are in play
+_PH_RE = re.compile(r'<<\s*([\w.-]+)\s*>>')
+_FILE_RE = re.compile(r'%%\s*(.*?)\s*%%')
+# Both placeholder kinds in one alternation so formatting scans the text once
+_ANY_PH_RE = re.compile(r'<<\s*([\w.-]+)\s*>>|%%\s*(.*?)\s*%%')
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _prompt_text_hash(prompt_text: str) -> str:
+    """SHA-256 of a prompt text, memoized at module level.
+
+    Keyed on the text itself rather than stored on the instance, so
+    templates sharing the same prompt hash once and instance __dict__
+    serialization stays untouched.
+    """
+    return hashlib.sha256(prompt_text.encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _load_file(path_str: str, mtime_ns: int, size: int) -> str:
+    """Runs the suffix handler for a file, cached on (path, mtime, size).
+
+    The stat fields key the cache, so editing a file invalidates its entry
+    while repeated formatting of the same template skips re-reading and
+    re-parsing unchanged files (PDF extraction in particular is costly).
+    """
+    path = Path(path_str)
+    handler = FILE_HANDLERS[path.suffix.lower()]
+    return handler(path)
+
+
+@dataclass(slots=True)
 class PromptTemplate:
     program: str  # Associated program
     type: str  # Type/category of the prompt
@@ -34,7 +65,9 @@ class PromptTemplate:
 
     def __post_init__(self):
         """Ensure venice_parameters is only set when explicitly provided."""
-        venice_params = copy.deepcopy(self.default_attributes.get('venice_parameters', {}))
+        # Constructing VeniceParameters already copies the values out of the
+        # dict, so the previous deepcopy of the whole mapping was pure overhead
+        venice_params = self.default_attributes.get('venice_parameters', {})
         if isinstance(venice_params, dict):
             self.default_attributes['venice_parameters'] = VeniceParameters(**venice_params)
 
@@ -43,15 +76,14 @@ class PromptTemplate:
         Extract placeholders of the format << variable >> from the prompt text.
         Returns a list of placeholder names.
         """
-        # return re.findall(r'<<\s*(.*?)\s*>>', self.prompt_text)
-        return re.findall(r'<<\s*([\w.-]+)\s*>>', self.prompt_text)
+        return _PH_RE.findall(self.prompt_text)
 
     def get_file_placeholders(self) -> list:
         """
         Extract file placeholders of the format [[ variable ]] from the prompt text.
         Returns a list of placeholder names.
         """
-        return re.findall(r'%%\s*(.*?)\s*%%', self.prompt_text)
+        return _FILE_RE.findall(self.prompt_text)
 
     def get_formatted_prompt(self, values: Dict[str, str | Path]) -> str:
         """
@@ -59,63 +91,68 @@ class PromptTemplate:
         - `<< variable >>` with text values.
         - `%% file_variable %%` with the **content of a file** (if given a Path or string filename, it reads the file).
         """
-        formatted_prompt = self.prompt_text
-        missing_keys = []
+        # Plain prompts (no placeholder markers at all) skip the regex pass
+        text = self.prompt_text
+        if '<<' not in text and '%%' not in text:
+            return text
 
-        # 🔹 Replace << variable >> placeholders
-        for key in self.get_placeholders():
-            if key in values and isinstance(values[key], str):
-                pattern = fr'<<\s*{re.escape(key)}\s*>>'
-                formatted_prompt = re.sub(pattern, values[key], formatted_prompt)
-            else:
-                missing_keys.append(f"<< {key} >>")
-
-        # 🔹 Replace %% file_variable %% placeholders
-        for key in self.get_file_placeholders():
-            if key in values:
-                file_content = None
-                file_path = values[key]
-
-                # ✅ Convert string paths to Path objects
-                if isinstance(file_path, str):
-                    file_path = Path(file_path)
-
-                if isinstance(file_path, Path):  # If it's a Path, read file content
-                    # if file_path.exists() and file_path.is_file():
-                    #     with file_path.open("r", encoding="utf-8") as f:
-                    #         file_content = f.read().strip()
-                    ext = file_path.suffix.lower()
-                    handler = FILE_HANDLERS.get(ext)
-
-                    if handler:
-                        try:
-                            file_content = handler(file_path)
-                            logger.debug(f"📄 Used handler for {ext}: {file_content[:50]}...")
-                        except Exception as e:
-                            file_content = f"[Error reading file: {file_path.name}]"
-                            logger.error(f"Handler error for {file_path}: {e}")
-                    else:
-                        file_content = f"[Unsupported file type: {ext}]"
-                        logger.debug(f"📄 Loaded file content for {key}: {file_content[:50]}...")
-                    # else:
-                    #     file_content = f"[ERROR: {file_path.name} not found]"
-                elif isinstance(values[key], str):  # If already a string, use as-is
-                    file_content = values[key]
-
-                # ✅ Replace placeholder if file content is found
-                # if file_content is not None:
-                #     pattern = fr'%%\s*{re.escape(key)}\s*%%'
-                #     formatted_prompt = re.sub(pattern, file_content, formatted_prompt)
-                if file_content is not None:
-                    formatted_prompt = formatted_prompt.replace(f"%% {key} %%", file_content)
+        missing_keys = []
+        resolved_files = {}  # per-call memo: repeated %% key %% resolves once
+
+        # 🔹 Both placeholder kinds resolve in one pass over the text
+        def replace(match):
+            text_key, file_key = match.groups()
+            if text_key is not None:
+                value = values.get(text_key)
+                if isinstance(value, str):
+                    return value
+                missing_keys.append(f"<< {text_key} >>")
+                return match.group(0)
+
+            if file_key not in values:
+                missing_keys.append(f"%% {file_key} %%")
+                return match.group(0)
+            if file_key in resolved_files:
+                file_content = resolved_files[file_key]
             else:
-                missing_keys.append(f"%% {key} %%")
+                file_content = resolved_files[file_key] = self._resolve_file_value(
+                    file_key, values[file_key])
+            return file_content if file_content is not None else match.group(0)
+
+        formatted_prompt = _ANY_PH_RE.sub(replace, text)
 
         if missing_keys:
-            logger.warning(f"Missing placeholders: {missing_keys}")
+            logger.warning("Missing placeholders: %s", missing_keys)
 
         return formatted_prompt
 
+    def _resolve_file_value(self, key, file_path) -> Optional[str]:
+        """Resolve a %% key %% value to text: read Paths via FILE_HANDLERS, pass strings through."""
+        # ✅ Convert string paths to Path objects
+        if isinstance(file_path, str) and not Path(file_path).suffix:
+            return file_path  # plain text value, use as-is
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
+
+        if isinstance(file_path, Path):  # If it's a Path, read file content
+            ext = file_path.suffix.lower()
+            handler = FILE_HANDLERS.get(ext)
+
+            if handler:
+                try:
+                    stat = file_path.stat()
+                    file_content = _load_file(str(file_path), stat.st_mtime_ns, stat.st_size)
+                    logger.debug("📄 Used handler for %s: %.50s...", ext, file_content)
+                except Exception as e:
+                    file_content = f"[Error reading file: {file_path.name}]"
+                    logger.error("Handler error for %s: %s", file_path, e)
+            else:
+                file_content = f"[Unsupported file type: {ext}]"
+                logger.debug("📄 Loaded file content for %s: %.50s...", key, file_content)
+            return file_content
+
+        return None
+
     def generate_prompt(self, prompt_text: str):
         """
         Updates the prompt with a new prompt_text and extracts placeholders dynamically.
@@ -142,10 +179,10 @@ class PromptTemplate:
                 file_content = f.read().strip()
                 file_values[placeholder_name] = file_content  # Store file contents
                 logger.debug(
-                    f"📄 Loaded file content for {placeholder_name}: {file_content[:100]}...")  # Log first 100 chars
+                    "📄 Loaded file content for %s: %.100s...", placeholder_name, file_content)  # Log first 100 chars
         else:
             file_values[file_path.stem] = f"[ERROR: {file_path.name} not found]"
-            logger.error(f"❌ File not found: {file_path}")
+            logger.error("❌ File not found: %s", file_path)
 
         return file_values
 
@@ -153,4 +190,4 @@ class PromptTemplate:
         """
         Returns the SHA-256 hash of the original prompt text before placeholders are completed.
         """
-        return hashlib.sha256(self.prompt_text.encode('utf-8')).hexdigest()
+        return _prompt_text_hash(self.prompt_text)
@@ -8,10 +8,14 @@ Includes:
 """
 
 
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-import hashlib
 
 import logging
 
@@ -19,20 +23,94 @@ import logging
 logger = logging.getLogger(__name__)
 
 from .prompt_attributes import PromptAttributes, VeniceParameters
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+from .utils.json import json_loads, json_dumps_bytes, json_dump_stream, fingerprint_canonical
 from .utils.markdown import MarkdownToText
 
 
+# Reasoning-tag markers used when splitting model output
+_THINK_START = '<think>'
+_THINK_END = '</think>'
+
+
+class _TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with socket tuning for chat-sized requests.
+
+    Disables Nagle (request payloads with long histories otherwise risk a
+    delayed-ACK stall), enables TCP keep-alive probing on the pooled
+    connections, and widens the receive buffer for long completions.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 262144),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
 class VeniceTextPrompt:
-    def __init__(self, api_key, model, base_url="https://api.venice.ai/api/v1"):
+    # Fixed attribute layout: chat loops read these on every turn, and slots
+    # make each access an offset load instead of a __dict__ lookup
+    __slots__ = (
+        "api_key", "model", "base_url", "_chat_url", "headers",
+        "parsed_response", "attributes",
+        "_attr_version", "_attr_dict", "_attr_dict_version",
+        "_cache_responses", "_response_cache", "_cache_dir", "_hash_memo",
+        "_session",
+    )
+
+    def __init__(self, api_key, model, base_url="https://api.venice.ai/api/v1",
+                 cache_responses=False, cache_dir=None):
         self.api_key = api_key
         self.model = model
         self.base_url = base_url
+        self._chat_url = f"{base_url}/chat/completions"  # built once, reused per request
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         self.parsed_response = None
         self.attributes = PromptAttributes()  # Create an instance of VenicePromptAttributes
+        # to_dict() cache, invalidated by the version counter set_attributes bumps
+        self._attr_version = 0
+        self._attr_dict = None
+        self._attr_dict_version = -1
+
+        # Optional exact-match response cache keyed by the payload fingerprint;
+        # a cache_dir additionally persists entries across processes
+        self._cache_responses = cache_responses or cache_dir is not None
+        self._response_cache = {}
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._hash_memo = {}  # prompt fingerprints keyed by inputs + attr version
+
+        # Pooled session: keep-alive reuses the TLS connection across prompts
+        # instead of renegotiating per request
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.mount("https://", _TunedHTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504]),
+        ))
+
+    def close(self):
+        """Closes the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def set_attributes(self, **kwargs):
         """Set attributes dynamically, ensuring venice_parameters is always initialized."""
@@ -45,48 +123,111 @@ class VeniceTextPrompt:
                         setattr(self.attributes, key, value)
                 else:
                     setattr(self.attributes, key, value)
+        self._attr_version += 1
+
+    def _attributes_dict(self):
+        """Returns attributes.to_dict(), rebuilt only after set_attributes changes.
+
+        The common pattern is setting attributes once and then prompting in a
+        loop, so the dataclass walk runs once instead of per request.
+        """
+        if self._attr_dict_version != self._attr_version:
+            self._attr_dict = self.attributes.to_dict()
+            self._attr_dict_version = self._attr_version
+        return self._attr_dict
+
+    def _build_payload(self, messages, attributes_dict):
+        """Assembles the chat-completions request body from messages and attributes.
+
+        One dict build via C-level unpacking rather than a Python loop; the
+        cached attributes dict is never mutated. An empty venice_parameters
+        entry is dropped, as before.
+        """
+        payload = {"model": self.model, "messages": messages, **attributes_dict}
+        if not payload.get("venice_parameters"):
+            payload.pop("venice_parameters", None)
+        return payload
+
+    def _cache_lookup(self, key):
+        """Returns a cached parsed response for `key`, or None."""
+        cached = self._response_cache.get(key)
+        if cached is None and self._cache_dir is not None:
+            entry = self._cache_dir / f"{key}.json"
+            if entry.exists():
+                try:
+                    cached = json_loads(entry.read_bytes())
+                except (ValueError, OSError) as err:
+                    # Truncated or unreadable entry (e.g. a write cut short);
+                    # drop it and treat the lookup as a miss
+                    logger.warning("Discarding corrupt response cache entry %s: %s",
+                                   entry.name, err)
+                    entry.unlink(missing_ok=True)
+                    return None
+                self._response_cache[key] = cached
+        return cached
+
+    def _cache_store(self, key, parsed_response):
+        """Stores a parsed response under `key`, persisting it if cache_dir is set."""
+        self._response_cache[key] = dict(parsed_response)
+        if self._cache_dir is not None:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                (self._cache_dir / f"{key}.json").write_bytes(
+                    json_dumps_bytes(parsed_response))
+            except (IOError, TypeError) as err:
+                logger.error("❌ Error writing response cache entry: %s", err)
 
     def prompt(self, user_prompt, system_prompt="You are a helpful assistant.", messages=None):
         """
         Sends a prompt to the Venice AI API and stores the parsed response.
         Uses VenicePromptAttributes for optional parameters.
         """
+        # Exact repeats short-circuit to the cached parsed response. Custom
+        # message histories bypass the cache: the fingerprint only covers
+        # (model, prompts, parameters)
+        cache_key = None
+        if self._cache_responses and messages is None:
+            cache_key = self.get_prompt_hash("inline", user_prompt, system_prompt)
+            cached = self._cache_lookup(cache_key)
+            if cached is not None:
+                logger.debug("Response cache hit for prompt hash %s", cache_key)
+                self.parsed_response = dict(cached)
+                return self.parsed_response
+
         if messages is None:
             messages = [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ]
 
-        payload = {
-            "model": self.model,
-            "messages": messages
-        }
-
-        # Add attributes from VenicePromptAttributes
-        attributes_dict = self.attributes.to_dict()
-        for key, value in attributes_dict.items():
-            if key == "venice_parameters":
-                if value:  # Only add if not empty
-                    payload["venice_parameters"] = value
-            else:
-                payload[key] = value
+        attributes_dict = self._attributes_dict()
+        payload = self._build_payload(messages, attributes_dict)
 
         #logger.debug("Sending request to Venice API:", json.dumps(payload, indent=4))  # Debugging
 
         try:
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=300
+            # Encode the payload ourselves (orjson when available) rather than
+            # going through requests' internal json.dumps; Content-Type is
+            # already set on the session headers
+            response = self._session.post(
+                self._chat_url,
+                data=json_dumps_bytes(payload),
+                timeout=300,
+                stream=True
             )
 
             # Log API response
-            logger.debug(f"🔹 API Response Received: Status Code {response.status_code}")
-            response_json = response.json()
+            logger.debug("🔹 API Response Received: Status Code %d", response.status_code)
+
+            # Accumulate the body in fixed-size chunks rather than letting
+            # requests materialize it in one shot, then parse the bytes once
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body.extend(chunk)
+            response_json = json_loads(body)
 
             if "error" in response_json:
-                logger.error(f"❌ API Error: {response_json['error']}")
+                logger.error("❌ API Error: %s", response_json['error'])
                 return None
 
             self.parsed_response = self.parse_response(response_json)
@@ -97,42 +238,122 @@ class VeniceTextPrompt:
                 "user_prompt": user_prompt,
                 "parameters": attributes_dict
             })
+            if cache_key is not None:
+                self._cache_store(cache_key, self.parsed_response)
             return self.parsed_response
 
         except requests.exceptions.ReadTimeout:
-            logger.error(f"❌ Read Timeout for prompt: {user_prompt}")
+            logger.error("❌ Read Timeout for prompt: %s", user_prompt)
             return None
         except requests.exceptions.HTTPError as e:
-            logger.error(f"❌ HTTP Error {e.response.status_code}: {e.response.text}")
+            logger.error("❌ HTTP Error %d: %s", e.response.status_code, e.response.text)
             return None
         except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Request failed: {e}")
+            logger.error("❌ Request failed: %s", e)
             return None
+        except ValueError as e:
+            # orjson/json decode errors on a non-JSON body (e.g. a gateway
+            # HTML error page); response.json() used to surface these as a
+            # RequestException subclass
+            logger.error("❌ Invalid JSON in response: %s", e)
+            return None
+
+    def prompt_many(self, user_prompts, system_prompt="You are a helpful assistant.",
+                    max_workers=8):
+        """
+        Sends a batch of prompts in parallel threads over the shared session.
+
+        Results are ordered to match `user_prompts`, with None for failed
+        requests as in `prompt`. The session's connection pool serves the
+        workers, so a batch costs roughly its slowest responses. Note that
+        `parsed_response` is left at whichever request finished last; use the
+        returned list. For async callers, `prompt_async` covers the same
+        ground without threads.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda up: self.prompt(up, system_prompt), user_prompts))
+
+    async def prompt_async(self, user_prompts, system_prompt="You are a helpful assistant.",
+                           concurrency=8):
+        """
+        Sends a batch of prompts concurrently and returns their parsed responses.
+
+        Requests overlap on a shared async client (at most `concurrency` in
+        flight), so a batch costs roughly its slowest responses instead of the
+        sum of every round trip. Failed requests yield None in the result list,
+        mirroring `prompt`. Requires the optional `httpx` package.
+        """
+        if httpx is None:
+            raise ImportError(
+                "prompt_async requires the optional 'httpx' package (pip install httpx)."
+            )
+
+        attributes_dict = self._attributes_dict()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(headers=self.headers, timeout=300) as client:
+
+            async def send(user_prompt):
+                messages = [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ]
+                payload = self._build_payload(messages, attributes_dict)
+                try:
+                    async with semaphore:
+                        response = await client.post(
+                            self._chat_url,
+                            content=json_dumps_bytes(payload)
+                        )
+                    response_json = json_loads(response.content)
+                except httpx.HTTPError as e:
+                    logger.error("❌ Request failed: %s", e)
+                    return None
+                except ValueError as e:
+                    # Malformed body must not raise through asyncio.gather
+                    # and take the whole batch down with it
+                    logger.error("❌ Invalid JSON in response: %s", e)
+                    return None
+
+                if "error" in response_json:
+                    logger.error("❌ API Error: %s", response_json['error'])
+                    return None
+
+                parsed = self.parse_response(response_json)
+                parsed.update({
+                    "system_prompt": system_prompt,
+                    "user_prompt": user_prompt,
+                    "parameters": attributes_dict
+                })
+                return parsed
+
+            return await asyncio.gather(*(send(p) for p in user_prompts))
 
     # Parce methods
     @staticmethod
     def parse_response(response_json):
         """Parses the API response to extract 'think' and 'response' sections."""
         # content = response_json['choices'][0]['message']['content']
-        logger.debug(f"Full response:\n{response_json}")
+        logger.debug("Full response:\n%s", response_json)
 
         content = response_json.get('choices', [{}])[0].get('message', {}).get('content', '')
 
-        if '</think>' in content:
-            think_end_index = content.find('</think>')
+        # partition splits in one scan; the separate find + slice pair
+        # walked the content twice
+        head, sep, tail = content.partition(_THINK_END)
+        if sep:
             parsed_response = {
-                'think': content[:think_end_index].strip(),
-                'response': content[think_end_index + len('</think>'):].strip()
+                'think': head.strip().removeprefix(_THINK_START).lstrip(),
+                'response': tail.strip()
             }
         else:
+            # No closing tag: a completion truncated mid-reasoning can still
+            # open with a dangling <think> marker, so scrub it here too
             parsed_response = {
                 'think': "",
-                'response': content.strip()
+                'response': content.strip().removeprefix(_THINK_START).lstrip()
             }
 
-        parsed_response['think'] = parsed_response['think'].replace('<think>', '').replace('</think>', '')
-        parsed_response['response'] = parsed_response['response'].replace('<think>', '').replace('</think>', '')
-
         # Extract citations if available
         venice_parameters = response_json.get('venice_parameters', {})
         citations = venice_parameters.get('web_search_citations', [])
@@ -177,8 +398,9 @@ class VeniceTextPrompt:
         if self.parsed_response:
             file_path = Path(file_path)
             file_path.parent.mkdir(parents=True, exist_ok=True)  # Create directory if not exists
-            with open(file_path, "w") as f:
-                json.dump(self.parsed_response, f, indent=4)
+            # Binary mode writes pre-encoded UTF-8 and skips newline translation
+            with open(file_path, "wb") as f:
+                json_dump_stream(self.parsed_response, f, pretty=True)
         else:
             logger.warning("No parsed response available to save.")
 
@@ -188,8 +410,8 @@ class VeniceTextPrompt:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
         if response:
-            with open(file_path, "w") as f:
-                f.write(response)
+            with open(file_path, "wb") as f:
+                f.write(response.encode("utf-8"))
         else:
             logger.warning("No response available to save.")
 
@@ -202,18 +424,20 @@ class VeniceTextPrompt:
         - output_path (str): Path to save the output plain text file.
         """
         try:
-            # Initialize the MarkdownToText handler
-            md_handler = MarkdownToText(md_file_path)
+            # Read the Markdown once and hand the text to the handler, so the
+            # conversion never goes back to disk
+            md_text = Path(md_file_path).read_text(encoding="utf-8")
+            md_handler = MarkdownToText.from_string(md_text)
 
-            # Extract clean text from the Markdown file
-            clean_text = md_handler.extract_clean_text()
+            # Extract clean text from the Markdown content
+            md_handler.extract_clean_text()
 
             # Save the clean text to the specified output path
             md_handler.save_clean_text(output_path)
 
-            logger.info(f"Clean text response saved to: {output_path}")
+            logger.info("Clean text response saved to: %s", output_path)
         except Exception as e:
-            logger.error(f"An error occurred while saving the text response: {e}")
+            logger.error("An error occurred while saving the text response: %s", e)
 
     # Hash methods
     def get_structured_payload_for_hash(
@@ -225,10 +449,30 @@ class VeniceTextPrompt:
             user_prompt_type: {
                 "model": self.model,
                 "user_prompt": user_prompt,
-                "parameters": self.attributes.to_dict()
+                "parameters": self._attributes_dict()
             }
         }
 
     def get_hash(self, structured_payload: dict) -> str:
-        return hashlib.sha256(json.dumps(structured_payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+        return fingerprint_canonical(structured_payload)
+
+    def get_prompt_hash(self, document_id: str, user_prompt: str, system_prompt: str,
+                        user_prompt_type: str = "request") -> str:
+        """Fingerprint of the standard structured payload, memoized per input.
+
+        In a chat loop only the user prompt changes between turns, so repeat
+        lookups skip both the payload build and the canonical serialization.
+        The attribute version is part of the key, so set_attributes naturally
+        invalidates stale entries.
+        """
+        key = (document_id, user_prompt, system_prompt, user_prompt_type,
+               self.model, self._attr_version)
+        cached = self._hash_memo.get(key)
+        if cached is None:
+            if len(self._hash_memo) >= 256:
+                self._hash_memo.clear()  # simple wholesale eviction
+            cached = self._hash_memo[key] = self.get_hash(
+                self.get_structured_payload_for_hash(
+                    document_id, user_prompt, system_prompt, user_prompt_type))
+        return cached
 
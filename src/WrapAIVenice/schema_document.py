@@ -13,13 +13,19 @@ from typing import Dict, Any, Union, Optional
 import json
 from pathlib import Path
 import logging
-import hashlib
 
 # Logger Configuration
 logger = logging.getLogger(__name__)
 
+from .utils.json import json_loads, json_dump_stream, fingerprint_canonical
 
-@dataclass
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+@dataclass(slots=True)
 class DocumentHeader:
     # Global header fields
     document_id: str
@@ -47,7 +53,7 @@ class DocumentHeader:
             system_prompt=data["payload"].get("system_prompt", ""))
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentDetail:
 
     # Prompt fields
@@ -111,25 +117,34 @@ class DocumentManager:
         self.file_path = Path(file_path)
         self.document_header: Optional[DocumentHeader] = None
         self.documents: Dict[str, DocumentDetail] = {}
+        self._hash_cache: Dict[str, str] = {}  # per-document hashes, dropped on mutation
 
     def create_header(self, document_id: str, system_prompt: str = ""):
         self.document_header = DocumentHeader(document_id=document_id, system_prompt=system_prompt)
+        self._hash_cache.clear()
 
     def add_document_detail(self, name: str, detail: DocumentDetail):
         self.documents[name] = detail
+        self._hash_cache.pop(name, None)
 
     def get_document_object(self, name: str) -> Optional[DocumentDetail]:
         return self.documents.get(name)
 
     def load_from_file(self) -> bool:
-        """Loads a Document instance from a JSON file."""
+        """Loads a Document instance from a JSON or MessagePack file."""
         if not self.file_path.exists():
             logger.warning(f"No saved document file found at {self.file_path}.")
             return False
 
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            raw = self.file_path.read_bytes()
+            if raw[:1] == b"{":  # JSON document; anything else is MessagePack
+                data = json_loads(raw)
+            elif msgpack is not None:
+                data = msgpack.unpackb(raw, raw=False)
+            else:
+                logger.error(f"{self.file_path} looks like MessagePack but msgpack is not installed.")
+                return False
 
             logger.info("🔄 Detected structured document format. Converting...")
             self.from_structured_dict(data)
@@ -142,16 +157,29 @@ class DocumentManager:
             logger.error(f"Error loading document from {self.file_path}: {err}")
             return False
 
-    def save_to_file(self) -> bool:
-        """Saves the full structured output (with hashes, header, etc.) to a JSON file."""
+    def save_to_file(self, binary: Optional[bool] = None) -> bool:
+        """Saves the full structured output (with hashes, header, etc.) to disk.
+
+        With `binary=True` (or a `.msgpack` file path) the document is written
+        as MessagePack, which is faster to pack and noticeably smaller than
+        indented JSON; JSON remains the default and the export format.
+        """
         if not self.document_header or not self.documents:
             logger.warning("⚠️ No document header or details to save. Skipping file write.")
             return False
 
+        use_binary = binary if binary is not None else self.file_path.suffix == ".msgpack"
+        if use_binary and msgpack is None:
+            logger.warning("msgpack not installed; saving JSON instead.")
+            use_binary = False
+
         try:
             structured = self.to_structured_output()
-            with self.file_path.open("w", encoding="utf-8") as json_file:
-                json.dump(structured, json_file, indent=4, ensure_ascii=False)
+            if use_binary:
+                self.file_path.write_bytes(msgpack.packb(structured, use_bin_type=True))
+            else:
+                with self.file_path.open("wb") as f:
+                    json_dump_stream(structured, f, pretty=True)
             logger.info(f"✅ Structured document saved to {self.file_path}")
             return True
 
@@ -175,6 +203,7 @@ class DocumentManager:
     def create_document_header(self, document_id: str, system_prompt: str = ""):
         """Initialize a Document header."""
         self.document_header = DocumentHeader(document_id=document_id, system_prompt=system_prompt)
+        self._hash_cache.clear()
 
     def update_document_detail(
             self,
@@ -198,6 +227,7 @@ class DocumentManager:
         doc.model_created = created
         doc.user_prompt = user_prompt
         doc.parameters = parameters
+        self._hash_cache.pop(name, None)
 
     def get_document_detail(self, name: str) -> Dict[str, Any]:
         doc = self.documents.get(name)
@@ -214,6 +244,15 @@ class DocumentManager:
             "system_prompt": self.document_header.system_prompt,
         }
 
+    @staticmethod
+    def _payload_entry(detail: DocumentDetail) -> Dict[str, Any]:
+        """The prompt-side fields of a document, as used in output and hashing."""
+        return {
+            "model": detail.model,
+            "user_prompt": detail.user_prompt,
+            "parameters": detail.parameters,
+        }
+
     def to_structured_output(self) -> dict:
         if not self.document_header:
             return {}
@@ -226,24 +265,25 @@ class DocumentManager:
         hashes = {}
 
         for name, detail in self.documents.items():
-            payload[name] = {
-                "model": detail.model,
-                "user_prompt": detail.user_prompt,
-                "parameters": detail.parameters,
-            }
+            # One payload entry per document, shared by reference between the
+            # output and the hash input (containment is by reference, so the
+            # encoder serializes the same subtree in both places)
+            entry = self._payload_entry(detail)
+            payload[name] = entry
             response[name] = {
                 "think": detail.think,
                 "results": detail.results,
                 "usage": detail.usage,
             }
-            hash_input = {
-                "document_id": payload["document_id"],
-                "system_prompt": payload["system_prompt"],
-                name: payload[name],
-            }
-            hashes[name] = hashlib.sha256(
-                json.dumps(hash_input, sort_keys=True, separators=(",", ":")).encode()
-            ).hexdigest()
+            cached = self._hash_cache.get(name)
+            if cached is None:
+                cached = fingerprint_canonical({
+                    "document_id": payload["document_id"],
+                    "system_prompt": payload["system_prompt"],
+                    name: entry,
+                })
+                self._hash_cache[name] = cached
+            hashes[name] = cached
 
         return {
             "header": {
@@ -262,6 +302,7 @@ class DocumentManager:
         payload = data["payload"]
         response = data["response"]
         self.documents.clear()
+        self._hash_cache.clear()
 
         for key in payload:
             if key in ("document_id", "system_prompt"):
@@ -276,12 +317,30 @@ class DocumentManager:
             )
             self.documents[key] = detail
 
+    def _compute_hash(self, name: str) -> Optional[str]:
+        """Hashes a single document block; the fingerprint matches VeniceTextPrompt.get_hash."""
+        if not self.document_header or name not in self.documents:
+            return None
+
+        hash_input = {
+            "document_id": self.document_header.document_id,
+            "system_prompt": self.document_header.system_prompt,
+            name: self._payload_entry(self.documents[name]),
+        }
+        return fingerprint_canonical(hash_input)
+
     def matches_hash(self, name: str, prompt_hash: str) -> bool:
-        hashes = self.to_structured_output().get("hashes", {})
-        return hashes.get(name) == prompt_hash
+        return self.get_hash(name) == prompt_hash
 
     def get_hash(self, name: str) -> Optional[str]:
-        return self.to_structured_output().get("hashes", {}).get(name)
+        cached = self._hash_cache.get(name)
+        if cached is not None:
+            return cached
+
+        digest = self._compute_hash(name)
+        if digest is not None:
+            self._hash_cache[name] = digest
+        return digest
 
     def has_document(self, name: str) -> bool:
         return name in self.documents
@@ -4,8 +4,11 @@ Utilities for formatting prompt templates.
 
 Includes:
 - `DataclassJSONEncoder`: Serializes dataclass instances to JSON-friendly dicts.
+- `json_loads`/`json_dumps_bytes`: JSON serde that prefers `orjson` when
+  installed and falls back to the stdlib.
 """
 
+import hashlib
 import json
 from dataclasses import asdict, is_dataclass
 import logging
@@ -13,8 +16,92 @@ import logging
 # Logger Configuration
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
 class DataclassJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         if is_dataclass(obj):
             return asdict(obj)
         return super().default(obj)
+
+
+# Encoder reused for canonical hashing: sorted keys and compact separators
+# define the byte stream that existing stored hashes were computed from
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+# Stdlib fallback encoders, instantiated once: json.dumps otherwise builds a
+# fresh JSONEncoder on every call
+_COMPACT_ENCODER = DataclassJSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_PRETTY_ENCODER = DataclassJSONEncoder(indent=2, ensure_ascii=False)
+
+
+def dumps_canonical(obj) -> bytes:
+    """Canonical JSON bytes for `obj`: sorted keys, compact separators.
+
+    Prefers orjson (C-speed, returns bytes directly); the stdlib fallback
+    escapes non-ASCII characters, so hashes of non-ASCII payloads differ
+    between backends. ASCII payloads serialize identically either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return _CANONICAL_ENCODER.encode(obj).encode()
+
+
+def fingerprint_canonical(obj) -> str:
+    """blake2b-128 hex fingerprint of the canonical JSON form of `obj`.
+
+    Used where a hash is an identity/cache key rather than a security
+    boundary: blake2b runs noticeably faster than SHA-256 and 16 bytes of
+    digest is ample for collision avoidance at this scale. Documents hashed
+    with the older SHA-256 scheme simply re-fingerprint on next save.
+
+    With orjson the canonical bytes come straight from C and feed the
+    hasher in one update; otherwise iterencode chunks stream in so large
+    payloads hash without materializing a second full copy.
+    """
+    if orjson is not None:
+        return hashlib.blake2b(dumps_canonical(obj), digest_size=16).hexdigest()
+    hasher = hashlib.blake2b(digest_size=16)
+    for chunk in _CANONICAL_ENCODER.iterencode(obj):
+        hasher.update(chunk.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def json_loads(data):
+    """Parses JSON from str or bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dump_stream(obj, fp, pretty=False):
+    """Writes `obj` as UTF-8 JSON to a binary file object.
+
+    With orjson the serialized bytes are written in one call; the stdlib
+    fallback streams iterencode chunks so large documents never hold both
+    the object tree and its full serialized form in memory at once.
+    """
+    if orjson is not None:
+        fp.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    for chunk in encoder.iterencode(obj):
+        fp.write(chunk.encode("utf-8"))
+
+
+def json_dumps_bytes(obj, pretty=False) -> bytes:
+    """Serializes an object to UTF-8 JSON bytes, preferring orjson when installed.
+
+    Dataclass instances are handled by both backends (orjson natively,
+    the stdlib via DataclassJSONEncoder).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    return encoder.encode(obj).encode("utf-8")
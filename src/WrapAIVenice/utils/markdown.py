@@ -7,6 +7,37 @@ import logging
 # Logger Configuration
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import; sanitizing runs per LLM response, so the
+# per-call re-compile/cache lookups and redundant scans add up
+_CODE_RE = re.compile(r'(?s:```.*?```)|`.*?`')  # fenced code blocks + inline code
+_IMAGE_RE = re.compile(r'!\[.*?\]\(.*?\)')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(.*?\)')  # keep the link text
+_STRONG_RE = re.compile(r'(\*\*|__)(.*?)\1')
+_EMPHASIS_RE = re.compile(r'(\*|_)(.*?)\1')
+_HRULE_RE = re.compile(r'^\s*[-*_]{3,}\s*$', re.MULTILINE)
+# Headings, blockquotes, and list markers share one line-start pass;
+# the trailing + strips stacked markers such as "> - item"
+_LINE_MARKUP_RE = re.compile(r'^\s*(?:(?:#{1,6}|>+)\s*|[-+*]\s+|\d+\.\s+)+', re.MULTILINE)
+_WS_RE = re.compile(r'\s{2,}')
+_SPACES_RE = re.compile(r'[ \t]{2,}')
+
+
+def _strip_markdown(md_text, collapse_newlines):
+    """Removes common Markdown syntax in a fixed set of precompiled passes."""
+    text = _CODE_RE.sub('', md_text)
+    text = _IMAGE_RE.sub('', text)
+    text = _LINK_RE.sub(r'\1', text)
+    text = _STRONG_RE.sub(r'\2', text)
+    text = _EMPHASIS_RE.sub(r'\2', text)
+    text = _HRULE_RE.sub('', text)
+    text = _LINE_MARKUP_RE.sub('', text)
+    if collapse_newlines:
+        text = _WS_RE.sub(' ', text)
+    else:
+        # Collapse multiple spaces/tabs without affecting newlines
+        text = _SPACES_RE.sub(' ', text)
+    return text.strip()
+
 class MarkdownToText:
     def __init__(self, resource_path):
         """Initialize with the MD path."""
@@ -14,12 +45,25 @@ class MarkdownToText:
         self.cleaned_text = ''
 
         self.md_path = Path(resource_path)
+        self.md_text = None
         if not self.md_path.exists():
             raise FileNotFoundError(f"File not found: {self.md_path}")
 
+    @classmethod
+    def from_string(cls, md_text):
+        """Builds a handler from already-loaded Markdown text, skipping file I/O."""
+        handler = cls.__new__(cls)
+        handler.text_has_been_cleaned = False
+        handler.cleaned_text = ''
+        handler.md_path = None
+        handler.md_text = md_text
+        return handler
+
     # Extract methods
     def extract_raw_text(self):
-        """Extracts raw text from the MD file."""
+        """Extracts raw text from the MD file (or the preloaded string)."""
+        if self.md_text is not None:
+            return self.md_text
         try:
             with self.md_path.open('r', encoding='utf-8') as file:
                 return file.read()
@@ -44,30 +88,7 @@ class MarkdownToText:
     @staticmethod
     def _strip_markdown(md_text):
         """Converts Markdown text to plain text by removing common Markdown syntax."""
-        # Remove code blocks
-        text = re.sub(r'```.*?```', '', md_text, flags=re.DOTALL)
-        # Remove inline code
-        text = re.sub(r'`.*?`', '', text)
-        # Remove images
-        text = re.sub(r'!\[.*?\]\(.*?\)', '', text)
-        # Remove links but keep the link text
-        text = re.sub(r'\[([^\]]+)\]\(.*?\)', r'\1', text)
-        # Remove emphasis and strong emphasis
-        text = re.sub(r'(\*\*|__)(.*?)\1', r'\2', text)
-        text = re.sub(r'(\*|_)(.*?)\1', r'\2', text)
-        # Remove headings
-        text = re.sub(r'^\s*#{1,6}\s*', '', text, flags=re.MULTILINE)
-        # Remove horizontal rules
-        text = re.sub(r'^\s*[-*_]{3,}\s*$', '', text, flags=re.MULTILINE)
-        # Remove blockquotes
-        text = re.sub(r'^\s*>+\s*', '', text, flags=re.MULTILINE)
-        # Remove unordered list markers
-        text = re.sub(r'^\s*[-+*]\s+', '', text, flags=re.MULTILINE)
-        # Remove ordered list numbers
-        text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)
-        # Remove extra spaces
-        text = re.sub(r'\s{2,}', ' ', text)
-        return text.strip()
+        return _strip_markdown(md_text, collapse_newlines=True)
 
     # Save methods
     def save_clean_text(self, output_path):
@@ -111,24 +132,7 @@ class MarkdownToTextFromString:
     @staticmethod
     def _strip_markdown(md_text):
         """Converts Markdown text to plain text by removing common Markdown syntax."""
-        text = re.sub(r'```.*?```', '', md_text, flags=re.DOTALL)  # Remove code blocks
-        text = re.sub(r'`.*?`', '', text)  # Remove inline code
-        text = re.sub(r'!\[.*?\]\(.*?\)', '', text)  # Remove images
-        text = re.sub(r'\[([^\]]+)\]\(.*?\)', r'\1', text)  # Remove links but keep text
-        text = re.sub(r'(\*\*|__)(.*?)\1', r'\2', text)  # Remove bold
-        text = re.sub(r'(\*|_)(.*?)\1', r'\2', text)  # Remove italics
-        text = re.sub(r'^\s*#{1,6}\s*', '', text, flags=re.MULTILINE)  # Remove headings
-        text = re.sub(r'^\s*[-*_]{3,}\s*$', '', text, flags=re.MULTILINE)  # Remove horizontal rules
-        text = re.sub(r'^\s*>+\s*', '', text, flags=re.MULTILINE)  # Remove blockquotes
-        text = re.sub(r'^\s*[-+*]\s+', '', text, flags=re.MULTILINE)  # Remove unordered lists
-        text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)  # Remove ordered lists
-        # text = re.sub(r'\s{2,}', ' ', text)  # Remove extra spaces
-        text = re.sub(r'[ \t]{2,}', ' ', text)  # Collapse multiple spaces/tabs without affecting newlines
-        text = re.sub(r' {2,}', ' ', text)
-
-
-
-        return text.strip()
+        return _strip_markdown(md_text, collapse_newlines=False)
 
     def save_clean_text(self, output_path):
         """Saves the plain text to a specified file path."""
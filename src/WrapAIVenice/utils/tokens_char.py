@@ -1,5 +1,8 @@
 # token_char.py
 
+from functools import lru_cache
+from hashlib import blake2b
+
 import tiktoken
 import logging
 
@@ -7,20 +10,65 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def get_encoding(model='gpt-3.5-turbo'):
+    """Returns the tiktoken encoding for a model, cached so it is only resolved once."""
+    try:
+        # Attempt to get encoding for the specified model
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback to a default encoding if model-specific encoding is unavailable
+        logger.error("Model '%s' not found. Using 'gpt-3.5-turbo' encoding as a fallback.", model)
+        return tiktoken.encoding_for_model("gpt-3.5-turbo")
+
+
 def count_characters_and_tokens(text, model='gpt-3.5-turbo'):
     """Returns the character count and token count of the input text."""
     # Character count
     char_count = len(text)
 
-    # Token count using tiktoken
-    try:
-        # Attempt to get encoding for the specified model
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # Fallback to a default encoding if model-specific encoding is unavailable
-        logger.error(f"Model '{model}' not found. Using 'gpt-3.5-turbo' encoding as a fallback.")
-        encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
+    # Token count using the cached tiktoken encoding
+    encoding = get_encoding(model)
 
     token_count = len(encoding.encode(text))
     return char_count, token_count
 
+
+# Token counts keyed by 16-byte content digests rather than the strings
+# themselves, so the cache never pins large message bodies in memory
+_TOKEN_CACHE_MAX = 4096
+_token_count_by_digest = {}
+
+
+def count_tokens(text, model='gpt-3.5-turbo'):
+    """Token count of `text`, cached by content digest.
+
+    Identical strings (system prompts, repeated boilerplate) hit the cache
+    instead of re-running the tokenizer on every trim/summarize pass.
+    """
+    key = (blake2b(text.encode(), digest_size=16).digest(), model)
+    cached = _token_count_by_digest.get(key)
+    if cached is not None:
+        return cached
+
+    tokens = len(get_encoding(model).encode(text))
+    if len(_token_count_by_digest) >= _TOKEN_CACHE_MAX:
+        _token_count_by_digest.clear()  # simple wholesale eviction
+    _token_count_by_digest[key] = tokens
+    return tokens
+
+
+@lru_cache(maxsize=256)
+def cached_token_count(text, model='gpt-3.5-turbo'):
+    """Token count memoized per exact text.
+
+    Intended for static prompts (system prompts, shared boilerplate) that
+    are re-counted by every chat session: they tokenize once per process.
+    Falls back to a ~4 chars/token estimate if no tokenizer is available.
+    """
+    try:
+        _, tokens = count_characters_and_tokens(text, model)
+    except Exception:
+        tokens = len(text) // 4
+    return tokens
+